@@ -10,27 +10,124 @@ URL using the `requests` library and returns the first N bytes of the content.
 """
 
 import functools
+import sys
+import threading
+import types
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Callable
 
+# Shared session, so repeated cache misses reuse keep-alive connections.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
 
-def lfu_cache(max_limit: int = 64) -> Callable:
+# Separates positional arguments from keyword items inside a cache key.
+_kwd_mark = (object(),)
+
+
+class _HashedSeq(list):
+    """List that computes its hash once, so cache lookups do not rehash it."""
+
+    __slots__ = 'hashvalue'
+
+    def __init__(self, tup: tuple, hash: Callable = hash):
+        self[:] = tup
+        self.hashvalue = hash(tup)
+
+    def __hash__(self) -> int:
+        return self.hashvalue
+
+
+def _make_key(args: tuple, kwargs: dict) -> object:
+    """Build a flat, hashable cache key from call arguments.
+
+    Keyword items are appended after a sentinel marker, sorted by name so
+    that the order they were passed in does not matter. A single keyword
+    argument needs no sorting.
+
+    Callers handle the positional-only case themselves: when `kwargs` is
+    empty they use `args` as the key and do not call this function.
+
+    Args:
+        args (tuple): Positional arguments of the call.
+        kwargs (dict): Keyword arguments of the call; must not be empty.
+
+    Returns:
+        object: A hashable key identifying the call.
+    """
+    if len(kwargs) == 1:
+        return _HashedSeq(args + _kwd_mark + tuple(kwargs.items()))
+    return _HashedSeq(args + _kwd_mark + tuple(sorted(kwargs.items())))
+
+
+def lfu_cache(max_limit: int | None = 64) -> Callable:
     """LFU cache decorator.
 
     This decorator caches the results of the decorated function using Least
     Frequently Used (LFU) strategy. When the cache reaches the `max_limit`, it
-    evicts the entry with the lowest usage frequency.
+    evicts the entry with the lowest usage frequency. Keys are grouped into
+    frequency buckets, so lookups, insertions and evictions all run in O(1).
+
+    The wrapper exposes read-only views `wrapper.cache` (key to result) and
+    `wrapper.usage` (key to hit count), plus `wrapper.cache_clear()` to empty
+    the cache. If `max_limit` is None, the cache grows without bound and the
+    decorator skips usage tracking entirely; `wrapper.usage` is not exposed.
 
     Args:
-        max_limit (int, optional): Maximum number of entries allowed in cache.
-            Defaults to 64.
+        max_limit (int | None, optional): Maximum number of entries allowed in
+            cache, or None for no limit. Defaults to 64.
 
     Returns:
         Callable: A decorator that wraps the target function with LFU caching.
+
+    Raises:
+        ValueError: If `max_limit` is not None or an integer of at least 1.
     """
+    if max_limit is not None and (
+        not isinstance(max_limit, int)
+        or isinstance(max_limit, bool)
+        or max_limit < 1
+    ):
+        raise ValueError(
+            f'max_limit must be None or an integer >= 1, got {max_limit!r}'
+        )
+
     def decorator(func: Callable) -> Callable:
         cache = {}
+        cache_get = cache.get
+        sentinel = object()
+
+        if max_limit is None:
+            @functools.wraps(func)
+            def unbounded_wrapper(*args, **kwargs):
+                """Cache every result of the decorated function.
+
+                Args:
+                    *args: Positional arguments for the function.
+                    **kwargs: Keyword arguments for the function.
+
+                Returns:
+                    Any: The result of the function, either from cache or
+                        computed.
+                """
+                key = _make_key(args, kwargs) if kwargs else args
+                result = cache_get(key, sentinel)
+                if result is sentinel:
+                    result = func(*args, **kwargs)
+                    cache[key] = result
+                return result
+
+            unbounded_wrapper.cache = types.MappingProxyType(cache)
+            unbounded_wrapper.cache_clear = cache.clear
+            return unbounded_wrapper
+
         usage = {}
+        # Keys grouped by usage frequency. Each bucket is a dict used as an
+        # insertion-ordered set, so the oldest key is evicted on a tie.
+        buckets = {}
+        min_freq = 0
+        # Guards the bookkeeping above, which spans several dicts.
+        lock = threading.RLock()
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -43,39 +140,112 @@ def lfu_cache(max_limit: int = 64) -> Callable:
             Returns:
                 Any: The result of the function, either from cache or computed.
             """
-            # Create a key based on the function's arguments.
-            # For kwargs, use a sorted tuple for consistency.
-            key = (args, tuple(sorted(kwargs.items())))
-            if key in cache:
-                usage[key] += 1
-                return cache[key]
+            nonlocal min_freq
+            # Skip the key builder call for positional-only calls.
+            key = _make_key(args, kwargs) if kwargs else args
+            with lock:
+                result = cache_get(key, sentinel)
+                if result is not sentinel:
+                    # Move the key to the next frequency bucket.
+                    freq = usage[key]
+                    bucket = buckets[freq]
+                    del bucket[key]
+                    if not bucket:
+                        del buckets[freq]
+                        if min_freq == freq:
+                            min_freq = freq + 1
+                    usage[key] = freq + 1
+                    buckets.setdefault(freq + 1, {})[key] = None
+                    return result
+            # Call the function without holding the lock, so slow calls
+            # such as network requests can run concurrently.
             result = func(*args, **kwargs)
-            if len(cache) >= max_limit:
-                # Find the key with the minimum usage frequency and remove it.
-                least_used_key = min(usage, key=usage.get)
-                cache.pop(least_used_key)
-                usage.pop(least_used_key)
-            cache[key] = result
-            usage[key] = 1
+            with lock:
+                if key in cache:
+                    # Another call stored this key while func was running.
+                    return result
+                if len(cache) >= max_limit:
+                    # The least used key is the oldest one in the lowest
+                    # bucket.
+                    bucket = buckets[min_freq]
+                    least_used_key = next(iter(bucket))
+                    del bucket[least_used_key]
+                    if not bucket:
+                        del buckets[min_freq]
+                    cache.pop(least_used_key)
+                    usage.pop(least_used_key)
+                cache[key] = result
+                usage[key] = 1
+                buckets.setdefault(1, {})[key] = None
+                min_freq = 1
             return result
 
-        # Expose the cache and usage dictionaries for external access.
-        wrapper.cache = cache
-        wrapper.usage = usage
+        def cache_clear():
+            """Remove every entry and reset the usage bookkeeping."""
+            nonlocal min_freq
+            with lock:
+                cache.clear()
+                usage.clear()
+                buckets.clear()
+                min_freq = 0
+
+        # Expose read-only views, so the bookkeeping cannot be desynchronized.
+        wrapper.cache = types.MappingProxyType(cache)
+        wrapper.usage = types.MappingProxyType(usage)
+        wrapper.cache_clear = cache_clear
         return wrapper
     return decorator
 
 
 @lfu_cache(max_limit=64)
-def fetch_url(url: str, first_n: int = 100) -> bytes:
+def _fetch_url_cached(url: str | bytes, first_n: int, /) -> bytes:
+    """Fetch a URL with positional-only arguments, so cache keys are uniform.
+
+    Args:
+        url (str | bytes): The URL to be fetched.
+        first_n (int): The number of bytes to return, or zero for all.
+
+    Returns:
+        bytes: The content retrieved from the URL.
+    """
+    if first_n <= 0:
+        res = _SESSION.get(url, timeout=5)
+        return res.content[:first_n] if first_n else res.content
+    # Ask only for the needed prefix. Identity encoding keeps the byte range
+    # meaningful, since ranges apply to the encoded body.
+    headers = {
+        'Range': f'bytes=0-{first_n - 1}',
+        'Accept-Encoding': 'identity',
+    }
+    with _SESSION.get(url, headers=headers, stream=True, timeout=5) as res:
+        if res.status_code == 416:
+            # Range Not Satisfiable: the resource is empty.
+            return b''
+        if res.status_code == 206:
+            # The partial body is at most first_n bytes. Reading it fully
+            # lets the connection return to the pool on close.
+            return res.content[:first_n]
+        # The server ignored the range. Read only the prefix; closing the
+        # unfinished response drops the connection instead of draining it.
+        return res.raw.read(first_n, decode_content=True)
+
+
+def fetch_url(url: str | bytes, first_n: int = 100) -> bytes:
     """Fetch a given URL and return the first_n bytes of its content.
 
-    This function sends an HTTP GET request to the specified URL using the
-    `requests` library. It returns the first `first_n` bytes of the response
-    content. If `first_n` is set to zero, the entire content is returned.
+    This function sends an HTTP GET request to the specified URL using a
+    shared `requests` session. For a positive `first_n` it streams the
+    response with a `Range` header and reads at most `first_n` bytes. When
+    the server honours the range, the connection goes back to the pool for
+    later requests; when it ignores it, the connection is closed rather than
+    drained. An empty resource yields empty content. If `first_n` is set to
+    zero, the entire content is returned.
+
+    Arguments are normalized before reaching the LFU cache, so positional and
+    keyword calls share one cache entry. String URLs are interned.
 
     Args:
-        url (str): The URL to be fetched.
+        url (str | bytes): The URL to be fetched.
         first_n (int, optional): The number of bytes to return from the fetched
             content. Defaults to 100.
 
@@ -83,8 +253,15 @@ def fetch_url(url: str, first_n: int = 100) -> bytes:
         bytes: The content retrieved from the URL, truncated to the first
             `first_n` bytes if `first_n` is not zero.
     """
-    res = requests.get(url)
-    return res.content[:first_n] if first_n else res.content
+    if isinstance(url, str):
+        url = sys.intern(url)
+    return _fetch_url_cached(url, first_n)
+
+
+# Expose the underlying cache statistics on the public function.
+fetch_url.cache = _fetch_url_cached.cache
+fetch_url.usage = _fetch_url_cached.usage
+fetch_url.cache_clear = _fetch_url_cached.cache_clear
 
 
 def main():
@@ -101,8 +278,8 @@ def main():
     print(cached_content)
 
     # Display cache keys and usage statistics.
-    print('Cache keys:', fetch_url.cache)
-    print('Usage counts:', fetch_url.usage)
+    print('Cache keys:', dict(fetch_url.cache))
+    print('Usage counts:', dict(fetch_url.usage))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,100 @@
+"""Behavior tests for the `lfu_cache` decorator."""
+
+import unittest
+
+from caching_lfu import lfu_cache
+
+
+def make_cached(max_limit):
+    """Return an LFU-cached identity function and its list of real calls."""
+    calls = []
+
+    @lfu_cache(max_limit=max_limit)
+    def identity(x, **kwargs):
+        calls.append(x)
+        return x
+
+    return identity, calls
+
+
+class LFUCacheTest(unittest.TestCase):
+    """Tests for eviction order, hit promotion and argument validation."""
+
+    def test_hit_returns_cached_result_and_counts_usage(self):
+        func, calls = make_cached(4)
+        self.assertEqual(func(1), 1)
+        self.assertEqual(func(1), 1)
+        self.assertEqual(calls, [1])
+        self.assertEqual(func.usage[(1,)], 2)
+
+    def test_evicts_least_frequently_used(self):
+        func, calls = make_cached(2)
+        func(1)
+        func(1)
+        func(2)
+        func(3)
+        self.assertEqual(set(func.cache), {(1,), (3,)})
+
+    def test_evicts_oldest_key_on_frequency_tie(self):
+        func, calls = make_cached(2)
+        func(1)
+        func(2)
+        func(3)
+        self.assertEqual(set(func.cache), {(2,), (3,)})
+
+    def test_hit_promotion_protects_key_from_eviction(self):
+        func, calls = make_cached(2)
+        func(1)
+        func(2)
+        func(2)
+        func(1)
+        func(1)
+        func(3)
+        self.assertEqual(set(func.cache), {(1,), (3,)})
+        self.assertEqual(func.usage[(1,)], 3)
+
+    def test_kwargs_order_shares_entry(self):
+        func, calls = make_cached(4)
+        func(1, a=1, b=2)
+        func(1, b=2, a=1)
+        self.assertEqual(calls, [1])
+
+    def test_views_are_read_only(self):
+        func, calls = make_cached(2)
+        func(1)
+        with self.assertRaises(TypeError):
+            func.cache[(2,)] = 2
+        with self.assertRaises(TypeError):
+            func.usage[(1,)] = 5
+
+    def test_cache_clear_resets_bookkeeping(self):
+        func, calls = make_cached(2)
+        func(1)
+        func(1)
+        func(2)
+        func.cache_clear()
+        self.assertEqual(len(func.cache), 0)
+        self.assertEqual(len(func.usage), 0)
+        func(3)
+        func(4)
+        func(5)
+        self.assertEqual(set(func.cache), {(4,), (5,)})
+
+    def test_unbounded_cache_never_evicts(self):
+        func, calls = make_cached(None)
+        for i in range(100):
+            func(i % 10)
+        self.assertEqual(len(calls), 10)
+        self.assertEqual(len(func.cache), 10)
+        func.cache_clear()
+        self.assertEqual(len(func.cache), 0)
+
+    def test_rejects_invalid_max_limit(self):
+        for bad in (0, -1, 1.5, True, '4'):
+            with self.subTest(max_limit=bad):
+                with self.assertRaises(ValueError):
+                    lfu_cache(bad)
+
+
+if __name__ == '__main__':
+    unittest.main()